@@ -2,35 +2,78 @@
 Main Flask application file.
 Initializes the app, configures CORS, JWT, and registers blueprints.
 """
-from flask import Flask, jsonify
-from flask_cors import CORS
-from flask_jwt_extended import JWTManager
+import time
+from flask import Flask, current_app, jsonify
 from config import Config
-from database import init_db, create_tables
-from routes.auth import auth_bp
-from routes.lists import lists_bp
-from routes.items import items_bp
-import models  # Import models so SQLAlchemy knows about them
+from responses import (
+    BAD_REQUEST,
+    UNAUTHORIZED,
+    FORBIDDEN,
+    NOT_FOUND,
+    CONFLICT,
+    INTERNAL_ERROR
+)
 
-# Initialize Flask app
-app = Flask(__name__)
+# Last database health probe result, shared by requests in this process
+_db_health = {'checked_at': None, 'connected': False}
 
-# Load configuration
-app.config.from_object(Config)
 
-# Initialize CORS with credentials support
-CORS(app, supports_credentials=True, origins="*")  # In production, specify actual origins
-
-# Initialize database
-init_db(app)
-
-# Initialize JWT
-jwt = JWTManager(app)
-
-# Register blueprints
-app.register_blueprint(auth_bp)
-app.register_blueprint(lists_bp)
-app.register_blueprint(items_bp)
+def create_app():
+    """
+    Create and configure the Flask application.
+    Heavy dependencies (SQLAlchemy, bcrypt, JWT, blueprints) are imported here
+    rather than at module level so importing this module stays cheap.
+    
+    Returns:
+        Flask: Configured application instance
+    """
+    from flask_cors import CORS
+    from database import init_db
+    from jwt_manager import CachedJWTManager
+    from json_provider import OrjsonProvider
+    from routes.auth import auth_bp
+    from routes.lists import lists_bp
+    from routes.items import items_bp
+    import models  # Import models so SQLAlchemy knows about them
+    
+    # Initialize Flask app
+    app = Flask(__name__)
+    
+    # Load configuration
+    app.config.from_object(Config)
+    
+    # Serialize JSON responses with orjson
+    app.json = OrjsonProvider(app)
+    
+    # Initialize CORS with credentials support (explicit origins, cached preflights)
+    CORS(
+        app,
+        supports_credentials=True,
+        origins=app.config['ALLOWED_ORIGINS'],
+        max_age=app.config['CORS_PREFLIGHT_MAX_AGE']
+    )
+    
+    # Initialize database
+    init_db(app)
+    
+    # Initialize JWT (with a short-lived cache of verified tokens)
+    CachedJWTManager(app)
+    
+    # Register blueprints
+    app.register_blueprint(auth_bp)
+    app.register_blueprint(lists_bp)
+    app.register_blueprint(items_bp)
+    
+    # Register error handlers and health check
+    app.register_error_handler(400, bad_request)
+    app.register_error_handler(401, unauthorized)
+    app.register_error_handler(403, forbidden)
+    app.register_error_handler(404, not_found)
+    app.register_error_handler(409, conflict)
+    app.register_error_handler(500, internal_error)
+    app.add_url_rule('/', view_func=health_check)
+    
+    return app
 
 
 # # JWT Error Handlers
@@ -85,7 +128,6 @@ app.register_blueprint(items_bp)
 
 
 # General Error Handlers
-@app.errorhandler(400)
 def bad_request(error):
     """
     Handle 400 Bad Request errors.
@@ -93,10 +135,9 @@ def bad_request(error):
     Returns:
         JSON error response
     """
-    return jsonify({'error': 'Bad request'}), 400
+    return BAD_REQUEST()
 
 
-@app.errorhandler(401)
 def unauthorized(error):
     """
     Handle 401 Unauthorized errors.
@@ -104,10 +145,9 @@ def unauthorized(error):
     Returns:
         JSON error response
     """
-    return jsonify({'error': 'Unauthorized'}), 401
+    return UNAUTHORIZED()
 
 
-@app.errorhandler(403)
 def forbidden(error):
     """
     Handle 403 Forbidden errors.
@@ -115,10 +155,9 @@ def forbidden(error):
     Returns:
         JSON error response
     """
-    return jsonify({'error': 'Forbidden'}), 403
+    return FORBIDDEN()
 
 
-@app.errorhandler(404)
 def not_found(error):
     """
     Handle 404 Not Found errors.
@@ -126,10 +165,9 @@ def not_found(error):
     Returns:
         JSON error response
     """
-    return jsonify({'error': 'Resource not found'}), 404
+    return NOT_FOUND()
 
 
-@app.errorhandler(409)
 def conflict(error):
     """
     Handle 409 Conflict errors.
@@ -137,10 +175,9 @@ def conflict(error):
     Returns:
         JSON error response
     """
-    return jsonify({'error': 'Resource conflict'}), 409
+    return CONFLICT()
 
 
-@app.errorhandler(500)
 def internal_error(error):
     """
     Handle 500 Internal Server errors.
@@ -148,25 +185,38 @@ def internal_error(error):
     Returns:
         JSON error response
     """
-    return jsonify({'error': 'Internal server error'}), 500
+    return INTERNAL_ERROR()
 
 
-@app.route('/')
 def health_check():
     """
     Health check endpoint.
+    The database probe result is cached for HEALTH_CHECK_CACHE_SECONDS so frequent
+    load-balancer probes don't hit the database on every request.
     
     Returns:
-        JSON response confirming API is running
+        JSON response confirming API is running (503 if the database is unreachable)
     """
-    return jsonify({'message': 'Flask API is running', 'status': 'ok'}), 200
+    from database import get_db_connection_status
+    
+    now = time.monotonic()
+    checked_at = _db_health['checked_at']
+    if checked_at is None or now - checked_at >= current_app.config['HEALTH_CHECK_CACHE_SECONDS']:
+        _db_health['connected'] = get_db_connection_status()
+        _db_health['checked_at'] = now
+    
+    if not _db_health['connected']:
+        return jsonify({'message': 'Flask API is running', 'status': 'degraded', 'database': 'unavailable'}), 503
+    
+    return jsonify({'message': 'Flask API is running', 'status': 'ok', 'database': 'connected'}), 200
 
 
 if __name__ == '__main__':
-    # Create database tables if they don't exist
-    with app.app_context():
-        create_tables(app)
+    from database import create_tables
+    
+    app = create_app()
     
-    # Run app on port 5001
-    app.run(debug=True, port=5001, host='0.0.0.0')
+    # Create database tables if they don't exist (create_tables pushes its own app context)
+    # (serve the app with gunicorn via wsgi.py; see README)
+    create_tables(app)
 
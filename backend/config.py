@@ -17,11 +17,44 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'postgresql://localhost/hollow_knight_todo')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # Connection pool configuration (passed to SQLAlchemy's create_engine)
+    if os.getenv('DB_DISABLE_POOL', 'false').lower() in ('1', 'true', 'yes'):
+        # Open a fresh connection per checkout (useful for SQLite/test environments).
+        # Imported only here so loading the config doesn't pull in SQLAlchemy.
+        from sqlalchemy.pool import NullPool
+        SQLALCHEMY_ENGINE_OPTIONS = {'poolclass': NullPool}
+        del NullPool
+    else:
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'pool_size': int(os.getenv('DB_POOL_SIZE', 25)),
+            'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 25)),
+            'pool_timeout': 30,  # seconds to wait for a free connection
+            'pool_recycle': 3600,  # recycle connections after 1 hour
+            'pool_pre_ping': True  # drop stale connections before use
+        }
+    
     # JWT configuration
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'super-secret-key')
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)  # 1 hour
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)  # 30 days
     JWT_TOKEN_LOCATION = ['headers']  # Support headers
+    JWT_DECODE_CACHE_TTL = int(os.getenv('JWT_DECODE_CACHE_TTL', 30))  # Seconds to reuse verified tokens (0 disables)
+    JWT_DECODE_CACHE_SIZE = int(os.getenv('JWT_DECODE_CACHE_SIZE', 4096))  # Max cached tokens
+    
+    # Password hashing configuration (bcrypt cost factor; lower it only for tests)
+    PASSWORD_HASH_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', 12))
+    
+    # CORS configuration
+    # Comma-separated list; whitespace around entries is ignored
+    ALLOWED_ORIGINS = [
+        origin.strip()
+        for origin in os.getenv('ALLOWED_ORIGINS', 'http://localhost:3000').split(',')
+        if origin.strip()
+    ]
+    CORS_PREFLIGHT_MAX_AGE = int(os.getenv('CORS_PREFLIGHT_MAX_AGE', 86400))  # Cache preflights for 1 day
+    
+    # Seconds to reuse the database probe result in the health check endpoint
+    HEALTH_CHECK_CACHE_SECONDS = float(os.getenv('HEALTH_CHECK_CACHE_SECONDS', 5))
     
     # Flask configuration
     FLASK_ENV = os.getenv('FLASK_ENV', 'development')
@@ -2,7 +2,10 @@
 Database utility functions for initializing and managing the database.
 """
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import case, insert, literal, select, text, update
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from collections import defaultdict
+from contextlib import contextmanager
 import logging
 
 # Initialize SQLAlchemy instance (will be initialized with app in init_db)
@@ -41,6 +44,11 @@ def create_tables(app):
     """
     try:
         with app.app_context():
+            # users.email is CITEXT on PostgreSQL, which lives in an extension
+            if db.engine.dialect.name == 'postgresql':
+                with db.engine.begin() as conn:
+                    conn.execute(text('CREATE EXTENSION IF NOT EXISTS citext'))
+            
             db.create_all()
             logger.info("Database tables created successfully")
     except SQLAlchemyError as e:
@@ -51,20 +59,34 @@ def create_tables(app):
         raise
 
 
-def get_db_connection_status(app):
+@contextmanager
+def session_scope():
+    """
+    Provide a transactional scope around a series of database operations.
+    Commits once when the block completes, rolls back and re-raises on error.
+    
+    Yields:
+        Session: The current SQLAlchemy session
+    """
+    try:
+        yield db.session
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def get_db_connection_status():
     """
     Check if database connection is working.
+    Must be called with an active application context (e.g. from a request handler).
     
-    Args:
-        app: Flask application instance
-        
     Returns:
         bool: True if connection is successful, False otherwise
     """
     try:
-        with app.app_context():
-            db.session.execute(db.text('SELECT 1'))
-            return True
+        db.session.execute(db.text('SELECT 1'))
+        return True
     except Exception as e:
         logger.error(f"Database connection check failed: {str(e)}")
         return False
@@ -74,19 +96,37 @@ def get_db_connection_status(app):
 # User Management Functions
 # ============================================================================
 
+def get_user_by_id(user_id):
+    """
+    Get a user by their ID.
+    
+    Args:
+        user_id: User ID
+        
+    Returns:
+        User: User object if found, None otherwise
+    """
+    try:
+        from models.user import User  # Import here to avoid circular imports
+        return db.session.get(User, user_id)
+    except Exception as e:
+        logger.error(f"Error getting user by id: {str(e)}")
+        return None
+
+
 def get_user_by_email(email):
     """
     Get a user by their email address.
     
     Args:
-        email: User's email address (will be lowercased)
+        email: User's email address (matched case-insensitively by the column type)
         
     Returns:
         User: User object if found, None otherwise
     """
     try:
         from models.user import User  # Import here to avoid circular imports
-        return User.query.filter_by(email=email.lower()).first()
+        return User.query.filter_by(email=email).first()
     except Exception as e:
         logger.error(f"Error getting user by email: {str(e)}")
         return None
@@ -98,7 +138,7 @@ def add_user(name, email, password):
     
     Args:
         name: User's full name
-        email: User's email address (will be lowercased)
+        email: User's email address (matched case-insensitively by the column type)
         password: Plain text password (will be hashed)
         
     Returns:
@@ -108,27 +148,24 @@ def add_user(name, email, password):
         from models.user import User  # Import here to avoid circular imports
         
         # Check if email already exists
-        existing_user = User.query.filter_by(email=email.lower()).first()
+        existing_user = User.query.filter_by(email=email).first()
         if existing_user:
             return None, "Email already exists"
         
         # Create new user
-        new_user = User(name=name, email=email.lower())
+        new_user = User(name=name, email=email)
         new_user.set_password(password)
         
-        # Add to session and commit
-        db.session.add(new_user)
-        db.session.commit()
+        with session_scope() as session:
+            session.add(new_user)
         
         logger.info(f"User created successfully: {email}")
         return new_user, None
         
     except IntegrityError:
-        db.session.rollback()
         logger.error(f"Integrity error creating user: {email}")
         return None, "Email already exists"
     except Exception as e:
-        db.session.rollback()
         logger.error(f"Error creating user: {str(e)}")
         return None, f"An error occurred during registration: {str(e)}"
 
@@ -138,7 +175,7 @@ def authenticate_user(email, password):
     Authenticate a user by email and password.
     
     Args:
-        email: User's email address (will be lowercased)
+        email: User's email address (matched case-insensitively by the column type)
         password: Plain text password to verify
         
     Returns:
@@ -148,7 +185,7 @@ def authenticate_user(email, password):
         from models.user import User  # Import here to avoid circular imports
         
         # Find user by email
-        user = User.query.filter_by(email=email.lower()).first()
+        user = User.query.filter_by(email=email).first()
         
         # Verify user exists and password is correct
         if not user:
@@ -179,11 +216,27 @@ def get_user_lists(user_id):
         user_id: User ID
         
     Returns:
-        list: List of List objects ordered by position
+        list: List of List objects ordered by position (with item counts preloaded)
     """
     try:
         from models.list import List  # Import here to avoid circular imports
-        return List.query.filter_by(user_id=user_id).order_by(List.position).all()
+        from models.item import Item  # Import here to avoid circular imports
+        
+        lists = List.query.filter_by(user_id=user_id).order_by(List.position).all()
+        if not lists:
+            return lists
+        
+        # Count top-level items for all lists in one aggregate query
+        counts = dict(
+            db.session.query(Item.list_id, db.func.count(Item.id))
+            .filter(Item.parent_id.is_(None), Item.list_id.in_([lst.id for lst in lists]))
+            .group_by(Item.list_id)
+            .all()
+        )
+        for lst in lists:
+            lst._item_count = counts.get(lst.id, 0)
+        
+        return lists
     except Exception as e:
         logger.error(f"Error getting user lists: {str(e)}")
         return []
@@ -201,7 +254,7 @@ def get_list_by_id(list_id):
     """
     try:
         from models.list import List  # Import here to avoid circular imports
-        return List.query.filter_by(id=list_id).first()
+        return db.session.get(List, list_id)
     except Exception as e:
         logger.error(f"Error getting list by id: {str(e)}")
         return None
@@ -230,26 +283,31 @@ def create_list(user_id, title):
         if len(title) > 200:
             return None, "Title must be 200 characters or less"
         
-        # Get the highest position for this user's lists
-        max_position = db.session.query(db.func.max(List.position)).filter_by(user_id=user_id).scalar()
-        new_position = (max_position or 0) + 1
-        
-        # Create new list
-        new_list = List(user_id=user_id, title=title, position=new_position)
+        # Next position (highest position + 1), computed inside the INSERT itself.
+        # This saves a round-trip but does not serialize concurrent creates: under
+        # READ COMMITTED two inserts can still compute the same position, and no
+        # unique constraint rejects the duplicate.
+        next_position = (
+            select(db.func.coalesce(db.func.max(List.position), 0) + 1)
+            .where(List.user_id == user_id)
+            .scalar_subquery()
+        )
         
-        # Add to session and commit
-        db.session.add(new_list)
-        db.session.commit()
+        # Create new list in a single round-trip (INSERT ... RETURNING)
+        with session_scope() as session:
+            new_list = session.scalars(
+                insert(List)
+                .values(user_id=user_id, title=title, position=next_position)
+                .returning(List)
+            ).one()
         
         logger.info(f"List created successfully: {title} for user {user_id}")
         return new_list, None
         
     except IntegrityError:
-        db.session.rollback()
         logger.error(f"Integrity error creating list: {title}")
         return None, "An error occurred while creating the list"
     except Exception as e:
-        db.session.rollback()
         logger.error(f"Error creating list: {str(e)}")
         return None, f"An error occurred while creating the list: {str(e)}"
 
@@ -269,33 +327,34 @@ def update_list(list_id, title=None, position=None):
     try:
         from models.list import List  # Import here to avoid circular imports
         
-        list_obj = List.query.filter_by(id=list_id).first()
+        list_obj = db.session.get(List, list_id)
         if not list_obj:
             return None, "List not found"
         
-        # Update title if provided
+        # Validate title if provided
         if title is not None:
             title = title.strip()
             if not title:
                 return None, "Title cannot be empty"
             if len(title) > 200:
                 return None, "Title must be 200 characters or less"
-            list_obj.title = title
         
-        # Update position if provided
+        # Validate position if provided
         if position is not None:
             if not isinstance(position, int) or position < 0:
                 return None, "Position must be a non-negative integer"
-            list_obj.position = position
         
-        # Commit changes
-        db.session.commit()
+        # Apply changes
+        with session_scope():
+            if title is not None:
+                list_obj.title = title
+            if position is not None:
+                list_obj.position = position
         
         logger.info(f"List updated successfully: {list_id}")
         return list_obj, None
         
     except Exception as e:
-        db.session.rollback()
         logger.error(f"Error updating list: {str(e)}")
         return None, f"An error occurred while updating the list: {str(e)}"
 
@@ -313,19 +372,18 @@ def delete_list(list_id):
     try:
         from models.list import List  # Import here to avoid circular imports
         
-        list_obj = List.query.filter_by(id=list_id).first()
+        list_obj = db.session.get(List, list_id)
         if not list_obj:
             return False, "List not found"
         
         # Delete list (cascade will delete all items)
-        db.session.delete(list_obj)
-        db.session.commit()
+        with session_scope() as session:
+            session.delete(list_obj)
         
         logger.info(f"List deleted successfully: {list_id}")
         return True, None
         
     except Exception as e:
-        db.session.rollback()
         logger.error(f"Error deleting list: {str(e)}")
         return False, f"An error occurred while deleting the list: {str(e)}"
 
@@ -334,28 +392,58 @@ def delete_list(list_id):
 # Item Management Functions
 # ============================================================================
 
-def get_list_items(list_id):
+def get_list_items_flat(list_id):
     """
-    Get all top-level items for a list with nested children (3 levels deep), ordered by position.
+    Get all items for a list as plain rows in a single query (no ORM objects).
     
     Args:
         list_id: List ID
         
     Returns:
-        list: List of Item objects (top-level only, with nested children loaded)
+        list: Row objects (id, title, completed, level, position, list_id, parent_id)
+              ordered by parent and position
     """
     try:
         from models.item import Item  # Import here to avoid circular imports
         
-        # Get all top-level items (parent_id is None) for this list
-        top_level_items = Item.query.filter_by(list_id=list_id, parent_id=None).order_by(Item.position).all()
-        
-        return top_level_items
+        return db.session.execute(
+            select(
+                Item.id,
+                Item.title,
+                Item.completed,
+                Item.level,
+                Item.position,
+                Item.list_id,
+                Item.parent_id
+            )
+            .where(Item.list_id == list_id)
+            .order_by(Item.parent_id, Item.position)
+        ).all()
     except Exception as e:
         logger.error(f"Error getting list items: {str(e)}")
         return []
 
 
+def serialize_items_tree(rows):
+    """
+    Build the nested item structure from flat rows in a single pass.
+    
+    Args:
+        rows: Rows as returned by get_list_items_flat
+        
+    Returns:
+        list: Top-level item dictionaries, each with nested 'children'
+    """
+    children = defaultdict(list)
+    for row in rows:
+        node = row._asdict()
+        # Share the list object so children appended later show up here
+        node['children'] = children[row.id]
+        children[row.parent_id].append(node)
+    
+    return children[None]
+
+
 def get_item_by_id(item_id):
     """
     Get a specific item by ID.
@@ -368,7 +456,7 @@ def get_item_by_id(item_id):
     """
     try:
         from models.item import Item  # Import here to avoid circular imports
-        return Item.query.filter_by(id=item_id).first()
+        return db.session.get(Item, item_id)
     except Exception as e:
         logger.error(f"Error getting item by id: {str(e)}")
         return None
@@ -403,66 +491,119 @@ def create_item(list_id, title, parent_id=None):
         if len(title) > 500:
             return None, "Title must be 500 characters or less"
         
-        # Verify list exists
-        list_obj = List.query.filter_by(id=list_id).first()
-        if not list_obj:
-            return None, "List not found"
-        
-        # Calculate level and validate hierarchy
+        # Verify the list exists (and, for sub-items, fetch the parent's details in
+        # the same query). Top-level items use session.get, which is served from
+        # the identity map when the caller has already loaded the list.
+        if parent_id is None:
+            if db.session.get(List, list_id) is None:
+                return None, "List not found"
+        else:
+            row = db.session.execute(
+                select(
+                    List.id,
+                    Item.id.label('parent_id'),
+                    Item.list_id.label('parent_list_id'),
+                    Item.level.label('parent_level'),
+                    Item.path.label('parent_path')
+                )
+                .select_from(List)
+                .outerjoin(Item, Item.id == parent_id)
+                .where(List.id == list_id)
+            ).first()
+            if row is None:
+                return None, "List not found"
+        
+        # Calculate level/path and validate hierarchy
         level = 1
+        path = '/'
         if parent_id is not None:
-            parent_item = Item.query.filter_by(id=parent_id).first()
-            if not parent_item:
+            if row.parent_id is None:
                 return None, "Parent item not found"
             
             # Verify parent belongs to same list
-            if parent_item.list_id != list_id:
+            if row.parent_list_id != list_id:
                 return None, "Parent item must belong to the same list"
             
-            # Calculate level based on parent (no maximum depth restriction)
-            level = parent_item.level + 1
-        
-        # Get the highest position for items at this level in this list
-        # If parent_id is provided, get position within parent's children
-        # Otherwise, get position for top-level items
-        if parent_id:
-            max_position = db.session.query(db.func.max(Item.position)).filter_by(
-                list_id=list_id, parent_id=parent_id
-            ).scalar()
-        else:
-            max_position = db.session.query(db.func.max(Item.position)).filter_by(
-                list_id=list_id, parent_id=None
-            ).scalar()
-        
-        new_position = (max_position or 0) + 1
-        
-        # Create new item
-        new_item = Item(
-            list_id=list_id,
-            title=title,
-            parent_id=parent_id,
-            position=new_position,
-            level=level
+            # Calculate level and path based on parent (no maximum depth restriction)
+            level = row.parent_level + 1
+            path = f'{row.parent_path}{row.parent_id}/'
+        
+        # Next position among the item's siblings (parent's children, or top-level
+        # items when parent_id is None), computed inside the INSERT itself. Like
+        # create_list, concurrent inserts may still end up with the same position.
+        # (plain = / IS NULL so ix_items_list_parent_position can serve the MAX;
+        # IS NOT DISTINCT FROM can't use a btree index)
+        same_parent = Item.parent_id.is_(None) if parent_id is None else Item.parent_id == parent_id
+        next_position = (
+            select(db.func.coalesce(db.func.max(Item.position), 0) + 1)
+            .where(Item.list_id == list_id, same_parent)
+            .scalar_subquery()
         )
         
-        # Add to session and commit
-        db.session.add(new_item)
-        db.session.commit()
+        # Create new item in a single round-trip (INSERT ... RETURNING)
+        with session_scope() as session:
+            new_item = session.scalars(
+                insert(Item)
+                .values(
+                    list_id=list_id,
+                    title=title,
+                    parent_id=parent_id,
+                    position=next_position,
+                    level=level,
+                    path=path
+                )
+                .returning(Item)
+            ).one()
         
         logger.info(f"Item created successfully: {title} in list {list_id} at level {level}")
         return new_item, None
         
     except IntegrityError:
-        db.session.rollback()
         logger.error(f"Integrity error creating item: {title}")
         return None, "An error occurred while creating the item"
     except Exception as e:
-        db.session.rollback()
         logger.error(f"Error creating item: {str(e)}")
         return None, f"An error occurred while creating the item: {str(e)}"
 
 
-def update_item(item_id, title=None, completed=None, position=None, list_id=None, parent_id=None):
+def bulk_create_items(mappings):
+    """
+    Insert many items at once, bypassing per-object ORM bookkeeping.
+    Intended for write-only ingestion such as imports or list duplication.
+    
+    Each mapping must provide every column explicitly (no positions, levels or
+    paths are computed here), and any parent_id must refer to an existing item:
+        {"list_id", "title", "parent_id", "position", "level", "path"}
+    
+    Args:
+        mappings: List of dictionaries describing the items to insert
+        
+    Returns:
+        tuple: (count, None) on success, (0, error_message) on failure
+    """
+    try:
+        from models.item import Item  # Import here to avoid circular imports
+        
+        if not mappings:
+            return 0, None
+        
+        # One executemany batch and a single commit for the whole set
+        with session_scope() as session:
+            session.bulk_insert_mappings(Item, mappings)
+        
+        logger.info(f"Bulk created {len(mappings)} items")
+        return len(mappings), None
+        
+    except IntegrityError:
+        logger.error("Integrity error bulk creating items")
+        return 0, "An error occurred while creating the items"
+    except Exception as e:
+        logger.error(f"Error bulk creating items: {str(e)}")
+        return 0, f"An error occurred while creating the items: {str(e)}"
+
+
+def update_item(item_id, title=None, completed=None, position=None, list_id=None, parent_id=None,
+                parent_id_provided=False):
     """
     Update item properties.
     
@@ -471,7 +612,9 @@ def update_item(item_id, title=None, completed=None, position=None, list_id=None
         title: New title (optional)
         completed: New completion status (optional)
         position: New position (optional)
-        list_id: New list ID (optional - for moving items, only top-level items can be moved)
+        list_id: New list ID (optional - for moving items; without a parent the item becomes top-level)
+        parent_id: New parent item ID (optional - None or 0 for top-level)
+        parent_id_provided: True if parent_id was explicitly given (so None means "move to top-level")
         
     Returns:
         tuple: (item, None) on success, (None, error_message) on failure
@@ -480,61 +623,60 @@ def update_item(item_id, title=None, completed=None, position=None, list_id=None
         from models.item import Item  # Import here to avoid circular imports
         from models.list import List  # Import here to avoid circular imports
         
-        item = Item.query.filter_by(id=item_id).first()
+        item = db.session.get(Item, item_id)
         if not item:
             return None, "Item not found"
         
-        # Update title if provided
+        # Validate title if provided
         if title is not None:
             title = title.strip()
             if not title:
                 return None, "Title cannot be empty"
             if len(title) > 500:
                 return None, "Title must be 500 characters or less"
-            item.title = title
-        
-        # Update completed status if provided
-        if completed is not None:
-            item.completed = bool(completed)
         
-        # Update position if provided
+        # Validate position if provided
         if position is not None:
             if not isinstance(position, int) or position < 0:
                 return None, "Position must be a non-negative integer"
-            item.position = position
         
-        # Helpers for subtree operations
+        # Helpers for subtree operations (materialized path, no tree walking)
         def is_descendant(possible_ancestor: Item, possible_descendant: Item) -> bool:
-            stack = list(possible_ancestor.children)
-            while stack:
-                node = stack.pop()
-                if node.id == possible_descendant.id:
-                    return True
-                stack.extend(list(node.children))
-            return False
-
-        def update_subtree_list_and_levels(root: Item, new_list_id: int, level_delta: int):
-            for child in root.children:
-                if new_list_id is not None:
-                    child.list_id = new_list_id
-                if level_delta != 0:
-                    child.level = max(1, child.level + level_delta)
-                update_subtree_list_and_levels(child, new_list_id, level_delta)
+            return possible_descendant.path.startswith(possible_ancestor.subtree_prefix)
+
+        def update_subtree(old_prefix: str, new_prefix: str, new_list_id: int, level_delta: int):
+            values = {}
+            if new_prefix != old_prefix:
+                values['path'] = literal(new_prefix) + db.func.substr(Item.path, len(old_prefix) + 1)
+            if new_list_id is not None:
+                values['list_id'] = new_list_id
+            if level_delta != 0:
+                values['level'] = Item.level + level_delta
+            if not values:
+                return
+            # Single UPDATE over every descendant (all share the old path prefix)
+            db.session.execute(
+                update(Item)
+                .where(Item.path.startswith(old_prefix))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
 
         # Resolve new parent and/or new list targets
+        moving_parent = parent_id_provided or parent_id is not None
+        if parent_id == 0:
+            parent_id = None
+        
         new_parent = None
         if parent_id is not None:
-            if parent_id == 0:
-                parent_id = None
-            else:
-                new_parent = Item.query.filter_by(id=parent_id).first()
-                if not new_parent:
-                    return None, "Target parent not found"
+            new_parent = db.session.get(Item, parent_id)
+            if not new_parent:
+                return None, "Target parent not found"
 
         # If moving lists, verify list exists
         target_list_id = list_id if list_id is not None else item.list_id
         if list_id is not None:
-            target_list = List.query.filter_by(id=list_id).first()
+            target_list = db.session.get(List, list_id)
             if not target_list:
                 return None, "Target list not found"
 
@@ -546,51 +688,120 @@ def update_item(item_id, title=None, completed=None, position=None, list_id=None
         if new_parent is not None and (new_parent.id == item.id or is_descendant(item, new_parent)):
             return None, "Cannot move an item under its own descendant"
 
-        # Apply move: compute new level and deltas
-        if parent_id is not None or list_id is not None:
-            old_level = item.level
-            old_list_id = item.list_id
-
-            # Set new list first on root item if changing lists
-            if list_id is not None:
-                item.list_id = target_list_id
-
-            # Set new parent (can be None for top-level)
-            item.parent_id = parent_id if parent_id is not None else item.parent_id
-            if parent_id is None:
-                item.parent_id = None
-
-            # Recalculate level: top-level => 1, else parent.level + 1
-            if item.parent_id is None:
-                item.level = 1
-            else:
-                # fetch parent to ensure we have its current level
-                parent_ref = new_parent or Item.query.filter_by(id=item.parent_id).first()
-                if not parent_ref:
-                    return None, "Target parent not found"
-                item.level = parent_ref.level + 1
-
-            level_delta = item.level - old_level
-
-            # Update subtree list_id and levels
-            update_subtree_list_and_levels(item, target_list_id if list_id is not None else None, level_delta)
-
-            logger.info(
-                f"Item {item_id} moved: list {old_list_id}->{item.list_id}, level {old_level}->{item.level}, parent {item.parent_id}"
-            )
-        
-        # Commit changes
-        db.session.commit()
+        # All validation passed; apply every change in one transaction
+        with session_scope():
+            if title is not None:
+                item.title = title
+            if completed is not None:
+                item.completed = bool(completed)
+            if position is not None:
+                item.position = position
+
+            # Apply move: compute new level and deltas
+            if moving_parent or list_id is not None:
+                old_level = item.level
+                old_list_id = item.list_id
+                old_prefix = item.subtree_prefix
+
+                # Set new list first on root item if changing lists
+                if list_id is not None:
+                    item.list_id = target_list_id
+
+                # Set new parent (None for top-level)
+                item.parent_id = parent_id
+
+                # Recalculate level and path: top-level => 1 and '/', else derived from parent
+                item.level = 1 if new_parent is None else new_parent.level + 1
+                item.path = '/' if new_parent is None else new_parent.subtree_prefix
+
+                level_delta = item.level - old_level
+
+                # Update subtree paths, list_id and levels
+                update_subtree(
+                    old_prefix,
+                    item.subtree_prefix,
+                    target_list_id if list_id is not None else None,
+                    level_delta
+                )
+
+                logger.info(
+                    f"Item {item_id} moved: list {old_list_id}->{item.list_id}, level {old_level}->{item.level}, parent {item.parent_id}"
+                )
         
         logger.info(f"Item updated successfully: {item_id}")
         return item, None
         
     except Exception as e:
-        db.session.rollback()
         logger.error(f"Error updating item: {str(e)}")
         return None, f"An error occurred while updating the item: {str(e)}"
 
 
+def reorder_items(list_id, parent_id, ordered_ids):
+    """
+    Reorder sibling items with a single UPDATE statement.
+    Positions are reassigned 1..N following the order of ordered_ids.
+    
+    Args:
+        list_id: List ID the items belong to
+        parent_id: Shared parent item ID (None or 0 for top-level items)
+        ordered_ids: Item IDs in their new order. Must be the complete set of
+            siblings under parent_id; a partial set is rejected so unlisted
+            siblings can't end up sharing a position with reordered ones.
+        
+    Returns:
+        tuple: (True, None) on success, (False, error_message) on failure
+    """
+    try:
+        from models.item import Item  # Import here to avoid circular imports
+        
+        if not ordered_ids:
+            return False, "At least one item ID is required"
+        
+        if len(set(ordered_ids)) != len(ordered_ids):
+            return False, "Item IDs must be unique"
+        
+        if parent_id == 0:
+            parent_id = None
+        
+        new_positions = {item_id: position for position, item_id in enumerate(ordered_ids, start=1)}
+        
+        # Plain = / IS NULL so ix_items_list_parent_position can be used
+        same_parent = Item.parent_id.is_(None) if parent_id is None else Item.parent_id == parent_id
+        
+        with session_scope() as session:
+            # Every sibling must be listed, otherwise positions would collide
+            sibling_count = session.execute(
+                select(db.func.count(Item.id))
+                .where(Item.list_id == list_id, same_parent)
+            ).scalar_one()
+            if sibling_count != len(ordered_ids):
+                raise ValueError("item_ids must list every sibling under the given parent")
+            
+            result = session.execute(
+                update(Item)
+                .where(
+                    Item.id.in_(ordered_ids),
+                    Item.list_id == list_id,
+                    same_parent
+                )
+                .values(position=case(new_positions, value=Item.id))
+                .execution_options(synchronize_session=False)
+            )
+            # Roll back if any ID was missing or not a sibling in this list
+            if result.rowcount != len(ordered_ids):
+                raise ValueError("All items must be siblings in the same list")
+        
+        logger.info(f"Items reordered successfully in list {list_id} under parent {parent_id}")
+        return True, None
+        
+    except ValueError as e:
+        logger.warning(f"Invalid reorder request for list {list_id}: {str(e)}")
+        return False, str(e)
+    except Exception as e:
+        logger.error(f"Error reordering items: {str(e)}")
+        return False, f"An error occurred while reordering items: {str(e)}"
+
+
 def delete_item(item_id):
     """
     Delete an item and all its children (cascade delete).
@@ -604,18 +815,17 @@ def delete_item(item_id):
     try:
         from models.item import Item  # Import here to avoid circular imports
         
-        item = Item.query.filter_by(id=item_id).first()
+        item = db.session.get(Item, item_id)
         if not item:
             return False, "Item not found"
         
         # Delete item (cascade will delete all children)
-        db.session.delete(item)
-        db.session.commit()
+        with session_scope() as session:
+            session.delete(item)
         
         logger.info(f"Item deleted successfully: {item_id}")
         return True, None
         
     except Exception as e:
-        db.session.rollback()
         logger.error(f"Error deleting item: {str(e)}")
         return False, f"An error occurred while deleting the item: {str(e)}"
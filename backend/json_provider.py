@@ -0,0 +1,81 @@
+"""
+JSON provider that serializes responses and parses request bodies with orjson
+instead of the stdlib json module.
+"""
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson (C implementation, several times faster
+    than json.dumps on the nested item-tree payloads).
+    
+    Types orjson does not handle natively fall back to Flask's default
+    serializer (e.g. Decimal, objects with __html__).
+    """
+    
+    # Key order carries no meaning for API clients; skip sorting unless enabled
+    sort_keys = False
+    
+    def dumps(self, obj, **kwargs):
+        """
+        Serialize data as a JSON string.
+        
+        Args:
+            obj: The data to serialize
+            **kwargs: Ignored (stdlib json options do not apply to orjson)
+            
+        Returns:
+            str: JSON encoded data
+        """
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        """
+        Deserialize data as JSON. Used by request.get_json(), which passes the
+        raw body bytes; orjson parses them directly without a str decode.
+        
+        Args:
+            s: Text or UTF-8 bytes
+            **kwargs: Ignored (stdlib json options do not apply to orjson)
+            
+        Returns:
+            The deserialized data (invalid JSON raises orjson.JSONDecodeError,
+            a ValueError subclass, so Flask still answers with 400)
+        """
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """
+        Serialize the given arguments as JSON and return a response object.
+        The body is passed to the response as bytes, skipping the str
+        decode/re-encode round trip of the default implementation.
+        
+        Args:
+            *args: A single value, or multiple values treated as a list
+            **kwargs: Keyword arguments treated as a dict
+            
+        Returns:
+            Response: JSON response with the application/json mimetype
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self._options() | orjson.OPT_APPEND_NEWLINE
+        
+        # Pretty-print in debug mode, matching Flask's default behaviour
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+        
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option),
+            mimetype=self.mimetype
+        )
+    
+    def _options(self):
+        """
+        Build the orjson option flags shared by dumps() and response().
+        
+        Returns:
+            int: orjson option bit flags
+        """
+        return orjson.OPT_SORT_KEYS if self.sort_keys else 0
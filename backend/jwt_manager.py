@@ -0,0 +1,96 @@
+"""
+JWT manager with a short-lived cache of verified token payloads.
+Avoids re-running signature verification for tokens seen moments ago.
+"""
+import threading
+import time
+from cachetools import TTLCache
+from flask_jwt_extended import JWTManager
+from responses import INVALID_TOKEN_IDENTITY
+
+
+class CachedJWTManager(JWTManager):
+    """
+    JWTManager that caches decoded claims per raw token for a short TTL.
+
+    Chatty frontends send the same bearer token on many requests per second;
+    caching the verified payload skips the repeated HMAC work. Cached entries
+    are never served past the token's own expiry, and blocklist/token-type
+    checks performed by flask_jwt_extended after decoding still run.
+
+    Tokens whose identity is not a numeric user ID (e.g. older tokens that
+    carried the email) are rejected with 401 so clients log in again.
+
+    Configuration:
+        JWT_DECODE_CACHE_TTL: Seconds a verified payload is reused (0 disables)
+        JWT_DECODE_CACHE_SIZE: Maximum number of cached tokens
+    """
+
+    def init_app(self, app, add_context_processor=False):
+        """
+        Register the extension with the app and create the decode cache.
+
+        Args:
+            app: Flask application instance
+            add_context_processor: Passed through to JWTManager.init_app
+        """
+        super().init_app(app, add_context_processor=add_context_processor)
+        self._cache_ttl = app.config.get('JWT_DECODE_CACHE_TTL', 30)
+        self._cache = TTLCache(maxsize=app.config.get('JWT_DECODE_CACHE_SIZE', 4096), ttl=self._cache_ttl or 1)
+        self._cache_lock = threading.Lock()  # TTLCache is not thread-safe
+        self._identity_claim = app.config.get('JWT_IDENTITY_CLAIM', 'sub')
+        
+        # Routes call int(get_jwt_identity()); reject anything else up front
+        self.token_verification_loader(self._has_user_id_identity)
+        self.token_verification_failed_loader(self._invalid_identity_response)
+    
+    def _has_user_id_identity(self, jwt_header, jwt_data):
+        """
+        Check that the token identity is a user ID.
+        
+        Args:
+            jwt_header: Decoded token header
+            jwt_data: Decoded token claims
+            
+        Returns:
+            bool: True if the identity is a numeric string
+        """
+        identity = jwt_data.get(self._identity_claim)
+        return isinstance(identity, str) and identity.isascii() and identity.isdigit()
+    
+    def _invalid_identity_response(self, jwt_header, jwt_data):
+        """
+        Respond to a token whose identity is not a user ID.
+        
+        Returns:
+            Response: JSON error response with 401 status
+        """
+        return INVALID_TOKEN_IDENTITY()
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        """
+        Decode and verify a token, reusing a recently verified payload if possible.
+
+        Args:
+            encoded_token: Raw encoded JWT string
+            csrf_value: CSRF value to verify (cookie-based tokens only)
+            allow_expired: If True, skip the cache and decode normally
+
+        Returns:
+            dict: Decoded token claims
+        """
+        if allow_expired or not self._cache_ttl:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        key = (encoded_token, csrf_value)
+        with self._cache_lock:
+            decoded = self._cache.get(key)
+
+        # Never serve a cached payload once the token itself has expired
+        if decoded is not None and decoded.get('exp', float('inf')) > time.time():
+            return dict(decoded)
+
+        decoded = super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+        with self._cache_lock:
+            self._cache[key] = decoded
+        return dict(decoded)
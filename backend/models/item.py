@@ -17,8 +17,16 @@ class Item(db.Model):
         parent_id: Foreign key to Item for hierarchical structure (nullable)
         position: Integer for ordering items within same level (default 0)
         level: Integer (1-3) representing depth: 1=item, 2=sub-item, 3=sub-sub-item
+        path: Materialized path of ancestor IDs (e.g. '/1/4/' for a child of item 4,
+              itself a child of item 1; '/' for top-level items)
     """
     __tablename__ = 'items'
+    __table_args__ = (
+        # Matches sibling lookups: filter on list/parent, order (or MAX) by position
+        db.Index('ix_items_list_parent_position', 'list_id', 'parent_id', 'position'),
+        # Supports prefix (LIKE 'prefix%') subtree lookups on path
+        db.Index('ix_items_path', 'path', postgresql_ops={'path': 'varchar_pattern_ops'}),
+    )
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     title = db.Column(db.String(500), nullable=False)
@@ -27,21 +35,30 @@ class Item(db.Model):
     parent_id = db.Column(db.Integer, db.ForeignKey('items.id', ondelete='CASCADE'), nullable=True, index=True)
     position = db.Column(db.Integer, default=0, nullable=False)
     level = db.Column(db.Integer, default=1, nullable=False)
+    path = db.Column(db.String(512), default='/', nullable=False)
     
     # Relationships
     parent = db.relationship('Item', remote_side=[id], backref=db.backref('children', lazy=True, cascade='all, delete-orphan', order_by='Item.position'))
     
-    def to_dict(self, include_children=True):
+    @property
+    def subtree_prefix(self):
         """
-        Convert item instance to dictionary with nested children if requested.
+        Path prefix shared by all descendants of this item.
         
-        Args:
-            include_children: If True, include nested children recursively
-            
         Returns:
-            dict: Item data with optional children
+            str: This item's path followed by its own ID (e.g. '/1/4/17/')
         """
-        result = {
+        return f'{self.path}{self.id}/'
+    
+    def to_dict(self):
+        """
+        Convert item instance to a flat dictionary (no children).
+        Nested trees are built from flat rows by database.serialize_items_tree.
+        
+        Returns:
+            dict: Item data
+        """
+        return {
             'id': self.id,
             'title': self.title,
             'completed': self.completed,
@@ -50,12 +67,6 @@ class Item(db.Model):
             'list_id': self.list_id,
             'parent_id': self.parent_id
         }
-        
-        if include_children:
-            # Include children up to 3 levels deep
-            result['children'] = [child.to_dict(include_children=True) for child in self.children]
-        
-        return result
     
     def __repr__(self):
         return f'<Item {self.title}>'
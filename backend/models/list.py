@@ -15,6 +15,10 @@ class List(db.Model):
         position: Integer for ordering lists (default 0)
     """
     __tablename__ = 'lists'
+    __table_args__ = (
+        # Matches per-user lookups ordered (or MAX'ed) by position
+        db.Index('ix_lists_user_position', 'user_id', 'position'),
+    )
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     title = db.Column(db.String(200), nullable=False)
@@ -32,11 +36,16 @@ class List(db.Model):
         Returns:
             dict: List data with item_count
         """
+        # Prefer the count preloaded by get_user_lists; fall back to loading items
+        item_count = getattr(self, '_item_count', None)
+        if item_count is None:
+            item_count = len([item for item in self.items if item.parent_id is None])  # Count only top-level items
+        
         return {
             'id': self.id,
             'title': self.title,
             'position': self.position,
-            'item_count': len([item for item in self.items if item.parent_id is None])  # Count only top-level items
+            'item_count': item_count
         }
     
     def __repr__(self):
@@ -1,9 +1,25 @@
 """
 User model for authentication and user management.
 """
+from flask import current_app
+from sqlalchemy.dialects.postgresql import CITEXT
 from database import db
 import bcrypt
-import re
+
+# Password character-class bit flags
+_UPPER = 1
+_LOWER = 2
+_DIGIT = 4
+_SPECIAL = 8
+
+# Byte -> character-class translation table (non-ASCII bytes count as special characters)
+_CLASS_MAP = bytes(
+    _UPPER if 65 <= b <= 90 else
+    _LOWER if 97 <= b <= 122 else
+    _DIGIT if 48 <= b <= 57 else
+    _SPECIAL
+    for b in range(256)
+)
 
 
 class User(db.Model):
@@ -13,15 +29,23 @@ class User(db.Model):
     Attributes:
         id: Primary key (auto-increment)
         name: User's full name (max 100 characters)
-        email: User's email address (unique, max 120 characters)
-        password_hash: Hashed password using bcrypt
+        email: User's email address (unique, case-insensitive, max 120 characters)
+        password_hash: Hashed password using bcrypt (stored as raw bytes)
     """
     __tablename__ = 'users'
     
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String(100), nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False, index=True)
-    password_hash = db.Column(db.String(255), nullable=False)
+    # Case-insensitive at the database level: CITEXT on PostgreSQL, NOCASE collation on SQLite
+    email = db.Column(
+        db.String(120)
+        .with_variant(CITEXT(), 'postgresql')
+        .with_variant(db.String(120, collation='NOCASE'), 'sqlite'),
+        unique=True,
+        nullable=False,
+        index=True
+    )
+    password_hash = db.Column(db.LargeBinary(60), nullable=False)  # Raw bcrypt hash bytes
     
     def set_password(self, password):
         """
@@ -30,9 +54,9 @@ class User(db.Model):
         Args:
             password: Plain text password to hash
         """
-        # Generate salt and hash password using bcrypt
-        salt = bcrypt.gensalt()
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        # Generate salt (cost factor from config) and hash password using bcrypt
+        salt = bcrypt.gensalt(rounds=current_app.config.get('PASSWORD_HASH_ROUNDS', 12))
+        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt)
     
     def check_password(self, password):
         """
@@ -46,7 +70,7 @@ class User(db.Model):
         """
         try:
             # Check password against stored hash
-            return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+            return bcrypt.checkpw(password.encode('utf-8'), self.password_hash)
         except Exception:
             return False
     
@@ -74,17 +98,22 @@ class User(db.Model):
         if len(password) < 8:
             return False, "Password must be at least 8 characters long"
         
-        if not re.search(r'[A-Z]', password):
+        # Map every byte to its class flag in C, then combine the (at most 4) distinct flags
+        flags = 0
+        for flag in set(password.encode('utf-8').translate(_CLASS_MAP)):
+            flags |= flag
+        
+        if not flags & _UPPER:
             return False, "Password must contain at least one uppercase letter"
         
-        if not re.search(r'[a-z]', password):
+        if not flags & _LOWER:
             return False, "Password must contain at least one lowercase letter"
         
-        if not re.search(r'\d', password):
+        if not flags & _DIGIT:
             return False, "Password must contain at least one number"
         
         # Check for special characters (non-alphanumeric)
-        if not re.search(r'[^A-Za-z0-9]', password):
+        if not flags & _SPECIAL:
             return False, "Password must contain at least one special character"
         
         return True, None
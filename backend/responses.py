@@ -0,0 +1,90 @@
+"""
+Prebuilt JSON error responses for messages that never change.
+The bodies are encoded once at import time, so the error paths skip the JSON encoder.
+"""
+import orjson
+from flask import Response
+
+
+class ErrorResponse:
+    """
+    Constant JSON error response: {"error": message} with a fixed status code.
+
+    Calling the instance returns a new Response around the pre-encoded body.
+    Response objects are not shared between requests because later hooks
+    (e.g. CORS) add headers to them.
+    """
+
+    __slots__ = ('body', 'status')
+
+    def __init__(self, message, status):
+        """
+        Encode the error body.
+
+        Args:
+            message: Error message
+            status: HTTP status code
+        """
+        self.body = orjson.dumps({'error': message}, option=orjson.OPT_APPEND_NEWLINE)
+        self.status = status
+
+    def __call__(self):
+        """
+        Build a response for the current request.
+
+        Returns:
+            Response: JSON error response
+        """
+        return Response(self.body, status=self.status, mimetype='application/json')
+
+
+# Generic errors (app-level error handlers)
+BAD_REQUEST = ErrorResponse('Bad request', 400)
+UNAUTHORIZED = ErrorResponse('Unauthorized', 401)
+FORBIDDEN = ErrorResponse('Forbidden', 403)
+NOT_FOUND = ErrorResponse('Resource not found', 404)
+CONFLICT = ErrorResponse('Resource conflict', 409)
+INTERNAL_ERROR = ErrorResponse('Internal server error', 500)
+INVALID_TOKEN_IDENTITY = ErrorResponse('Invalid token, please log in again', 401)
+
+# Request validation
+BODY_REQUIRED = ErrorResponse('Request body is required', 400)
+NAME_REQUIRED = ErrorResponse('Name is required', 400)
+NAME_TOO_LONG = ErrorResponse('Name must be 100 characters or less', 400)
+EMAIL_REQUIRED = ErrorResponse('Email is required', 400)
+INVALID_EMAIL = ErrorResponse('Invalid email format', 400)
+EMAIL_TOO_LONG = ErrorResponse('Email must be 120 characters or less', 400)
+PASSWORD_REQUIRED = ErrorResponse('Password is required', 400)
+TITLE_REQUIRED = ErrorResponse('Title is required', 400)
+LIST_UPDATE_FIELDS_REQUIRED = ErrorResponse('At least one field (title or position) must be provided', 400)
+INVALID_PARENT_ID = ErrorResponse('parent_id must be an integer or null', 400)
+ITEM_IDS_REQUIRED = ErrorResponse('item_ids must be a non-empty list', 400)
+INVALID_ITEM_IDS = ErrorResponse('item_ids must contain only integers', 400)
+
+# Missing resources
+USER_NOT_FOUND = ErrorResponse('User not found', 404)
+LIST_NOT_FOUND = ErrorResponse('List not found', 404)
+TARGET_LIST_NOT_FOUND = ErrorResponse('Target list not found', 404)
+ITEM_NOT_FOUND = ErrorResponse('Item not found', 404)
+
+# Ownership checks
+LIST_ACCESS_FORBIDDEN = ErrorResponse('You do not have permission to access this list', 403)
+LIST_MODIFY_FORBIDDEN = ErrorResponse('You do not have permission to modify this list', 403)
+LIST_DELETE_FORBIDDEN = ErrorResponse('You do not have permission to delete this list', 403)
+ITEM_ADD_FORBIDDEN = ErrorResponse('You do not have permission to add items to this list', 403)
+ITEM_MODIFY_FORBIDDEN = ErrorResponse('You do not have permission to modify this item', 403)
+ITEM_MOVE_FORBIDDEN = ErrorResponse('You do not have permission to move items to this list', 403)
+ITEM_DELETE_FORBIDDEN = ErrorResponse('You do not have permission to delete this item', 403)
+
+# Unexpected failures
+REGISTRATION_FAILED = ErrorResponse('An error occurred during registration', 500)
+LOGIN_FAILED = ErrorResponse('An error occurred during login', 500)
+FETCH_LISTS_FAILED = ErrorResponse('An error occurred while fetching lists', 500)
+CREATE_LIST_FAILED = ErrorResponse('An error occurred while creating the list', 500)
+UPDATE_LIST_FAILED = ErrorResponse('An error occurred while updating the list', 500)
+DELETE_LIST_FAILED = ErrorResponse('An error occurred while deleting the list', 500)
+FETCH_ITEMS_FAILED = ErrorResponse('An error occurred while fetching items', 500)
+CREATE_ITEM_FAILED = ErrorResponse('An error occurred while creating the item', 500)
+UPDATE_ITEM_FAILED = ErrorResponse('An error occurred while updating the item', 500)
+REORDER_ITEMS_FAILED = ErrorResponse('An error occurred while reordering items', 500)
+DELETE_ITEM_FAILED = ErrorResponse('An error occurred while deleting the item', 500)
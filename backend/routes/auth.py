@@ -1,14 +1,30 @@
 """
 Authentication routes for user registration, login, and logout.
 """
+import re
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity, unset_jwt_cookies
-from database import get_user_by_email, add_user, authenticate_user
+from database import get_user_by_id, add_user, authenticate_user
+from responses import (
+    BODY_REQUIRED,
+    NAME_REQUIRED,
+    NAME_TOO_LONG,
+    EMAIL_REQUIRED,
+    INVALID_EMAIL,
+    EMAIL_TOO_LONG,
+    PASSWORD_REQUIRED,
+    USER_NOT_FOUND,
+    REGISTRATION_FAILED,
+    LOGIN_FAILED
+)
 from models.user import User
 
 # Create blueprint for auth routes
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
+# Basic email format: local@domain.tld, no whitespace or extra '@'
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
 
 @auth_bp.route('/register', methods=['POST'])
 def register():
@@ -31,29 +47,33 @@ def register():
         
         # Validate input
         if not data:
-            return jsonify({'error': 'Request body is required'}), 400
+            return BODY_REQUIRED()
         
         name = data.get('name', '').strip()
-        email = data.get('email', '').strip().lower()
+        email = data.get('email', '').strip()
         password = data.get('password', '')
         
         # Validate required fields
         if not name:
-            return jsonify({'error': 'Name is required'}), 400
+            return NAME_REQUIRED()
         
         if not email:
-            return jsonify({'error': 'Email is required'}), 400
+            return EMAIL_REQUIRED()
         
         if not password:
-            return jsonify({'error': 'Password is required'}), 400
+            return PASSWORD_REQUIRED()
         
         # Validate email format (basic validation)
-        if '@' not in email or '.' not in email:
-            return jsonify({'error': 'Invalid email format'}), 400
+        if not _EMAIL_RE.match(email):
+            return INVALID_EMAIL()
+        
+        # Validate email length (CITEXT on PostgreSQL does not enforce it)
+        if len(email) > 120:
+            return EMAIL_TOO_LONG()
         
         # Validate name length
         if len(name) > 100:
-            return jsonify({'error': 'Name must be 100 characters or less'}), 400
+            return NAME_TOO_LONG()
         
         # Validate password requirements
         is_valid, error_message = User.validate_password(password)
@@ -76,7 +96,7 @@ def register():
         }), 201
 
     except Exception as e:
-        return jsonify({'error': 'An error occurred during registration'}), 500
+        return REGISTRATION_FAILED()
 
 
 @auth_bp.route('/login', methods=['POST'])
@@ -98,17 +118,17 @@ def login():
         
         # Validate input
         if not data:
-            return jsonify({'error': 'Request body is required'}), 400
+            return BODY_REQUIRED()
         
-        email = data.get('email', '').strip().lower()
+        email = data.get('email', '').strip()
         password = data.get('password', '')
         
         # Validate required fields
         if not email:
-            return jsonify({'error': 'Email is required'}), 400
+            return EMAIL_REQUIRED()
         
         if not password:
-            return jsonify({'error': 'Password is required'}), 400
+            return PASSWORD_REQUIRED()
         
         # Authenticate user using database function
         user, error_message = authenticate_user(email, password)
@@ -116,9 +136,9 @@ def login():
         if not user:
             return jsonify({'error': error_message}), 401
         
-        # Generate JWT tokens
-        access_token = create_access_token(identity=user.email)
-        refresh_token = create_refresh_token(identity=user.email)
+        # Generate JWT tokens (identity is the user ID so protected routes skip user lookups)
+        access_token = create_access_token(identity=str(user.id))
+        refresh_token = create_refresh_token(identity=str(user.id))
         
         return jsonify({
             'access_token': access_token,
@@ -127,7 +147,7 @@ def login():
         }), 200
         
     except Exception as e:
-        return jsonify({'error': 'An error occurred during login'}), 500
+        return LOGIN_FAILED()
 
 
 # TODO: handle logout in frontend by clearing the token form local storage
@@ -160,12 +180,12 @@ def get_current_user():
     - Provides user_id via get_jwt_identity()
     """
     try:
-        # Extract user_id from JWT token (set during login/register)
-        email = get_jwt_identity()
-        user = get_user_by_email(email)
+        # Extract user_id from JWT token (set during login) and look up by primary key
+        user_id = int(get_jwt_identity())
+        user = get_user_by_id(user_id)
         
         if not user:
-            return jsonify({'error': 'User not found'}), 404
+            return USER_NOT_FOUND()
 
         return jsonify({'user': user.to_dict()}), 200
     
@@ -5,14 +5,36 @@ All endpoints require JWT authentication.
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from database import (
-    get_user_by_email,
     get_list_by_id,
-    get_list_items,
+    get_list_items_flat,
+    serialize_items_tree,
     get_item_by_id,
     create_item,
     update_item,
+    reorder_items,
     delete_item
 )
+from responses import (
+    BODY_REQUIRED,
+    TITLE_REQUIRED,
+    INVALID_PARENT_ID,
+    ITEM_IDS_REQUIRED,
+    INVALID_ITEM_IDS,
+    LIST_NOT_FOUND,
+    TARGET_LIST_NOT_FOUND,
+    ITEM_NOT_FOUND,
+    LIST_ACCESS_FORBIDDEN,
+    LIST_MODIFY_FORBIDDEN,
+    ITEM_ADD_FORBIDDEN,
+    ITEM_MODIFY_FORBIDDEN,
+    ITEM_MOVE_FORBIDDEN,
+    ITEM_DELETE_FORBIDDEN,
+    FETCH_ITEMS_FAILED,
+    CREATE_ITEM_FAILED,
+    UPDATE_ITEM_FAILED,
+    REORDER_ITEMS_FAILED,
+    DELETE_ITEM_FAILED
+)
 
 # Create blueprint for item routes
 items_bp = Blueprint('items', __name__)
@@ -30,31 +52,27 @@ def get_items_for_list(list_id):
         Status: 200, 403, 404
     """
     try:
-        # Get user email from JWT token
-        email = get_jwt_identity()
-        user = get_user_by_email(email)
-        
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
+        # Get user ID from JWT token (no users-table lookup needed)
+        user_id = int(get_jwt_identity())
         
         # Get list and verify ownership
         list_obj = get_list_by_id(list_id)
         if not list_obj:
-            return jsonify({'error': 'List not found'}), 404
+            return LIST_NOT_FOUND()
         
-        if list_obj.user_id != user.id:
-            return jsonify({'error': 'You do not have permission to access this list'}), 403
+        if list_obj.user_id != user_id:
+            return LIST_ACCESS_FORBIDDEN()
         
-        # Get all items for the list using database function
-        items = get_list_items(list_id)
+        # Get all items for the list as flat rows (single query)
+        rows = get_list_items_flat(list_id)
         
         # Convert to dictionary format with nested children
-        items_data = [item.to_dict(include_children=True) for item in items]
+        items_data = serialize_items_tree(rows)
         
         return jsonify({'items': items_data}), 200
         
     except Exception as e:
-        return jsonify({'error': 'An error occurred while fetching items'}), 500
+        return FETCH_ITEMS_FAILED()
 
 
 @items_bp.route('/lists/<int:list_id>/items', methods=['POST'])
@@ -79,45 +97,33 @@ def create_new_item(list_id):
         
         # Validate input
         if not data:
-            return jsonify({'error': 'Request body is required'}), 400
+            return BODY_REQUIRED()
         
         title = data.get('title', '').strip()
         parent_id = data.get('parent_id')
         
         # Validate required fields
         if not title:
-            return jsonify({'error': 'Title is required'}), 400
-        
-        # Get user email from JWT token
-        email = get_jwt_identity()
-        user = get_user_by_email(email)
+            return TITLE_REQUIRED()
         
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
+        # Get user ID from JWT token (no users-table lookup needed)
+        user_id = int(get_jwt_identity())
         
         # Get list and verify ownership
         list_obj = get_list_by_id(list_id)
         if not list_obj:
-            return jsonify({'error': 'List not found'}), 404
-        
-        if list_obj.user_id != user.id:
-            return jsonify({'error': 'You do not have permission to add items to this list'}), 403
-        
-        # Validate parent_id if provided
-        if parent_id is not None:
-            parent_item = get_item_by_id(parent_id)
-            if not parent_item:
-                return jsonify({'error': 'Parent item not found'}), 404
-            
-            # Verify parent belongs to same list
-            if parent_item.list_id != list_id:
-                return jsonify({'error': 'Parent item must belong to the same list'}), 400
-        
-        # Create item using database function
+            return LIST_NOT_FOUND()
+        
+        if list_obj.user_id != user_id:
+            return ITEM_ADD_FORBIDDEN()
+        
+        # Create item using database function (validates the parent in the same lookup)
         new_item, error_message = create_item(list_id, title, parent_id=parent_id)
         
         if not new_item:
-            return jsonify({'error': error_message}), 400
+            # Determine status code based on error
+            status_code = 404 if error_message in ("List not found", "Parent item not found") else 400
+            return jsonify({'error': error_message}), status_code
         
         return jsonify({
             'message': 'Item created successfully',
@@ -132,7 +138,7 @@ def create_new_item(list_id):
         }), 201
         
     except Exception as e:
-        return jsonify({'error': 'An error occurred while creating the item'}), 500
+        return CREATE_ITEM_FAILED()
 
 
 @items_bp.route('/items/<int:item_id>', methods=['PUT'])
@@ -161,57 +167,50 @@ def update_existing_item(item_id):
 
         # Validate input
         if not data:
-            return jsonify({'error': 'Request body is required'}), 400
+            return BODY_REQUIRED()
         
         title = data.get('title')
         completed = data.get('completed')
         position = data.get('position')
         new_list_id = data.get('list_id')
-        new_parent_id = data.get('parent_id') if 'parent_id' in data else None
+        parent_id_provided = 'parent_id' in data
+        new_parent_id = data['parent_id'] if parent_id_provided else None
         
-        # Get user email from JWT token
-        email = get_jwt_identity()
-        user = get_user_by_email(email)
+        # Get user ID from JWT token (no users-table lookup needed)
+        user_id = int(get_jwt_identity())
         
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
-
         # Get item and verify ownership through list
         item = get_item_by_id(item_id)
         if not item:
-            return jsonify({'error': 'Item not found'}), 404
+            return ITEM_NOT_FOUND()
         
         list_obj = get_list_by_id(item.list_id)
-        if not list_obj or list_obj.user_id != user.id:
-            return jsonify({'error': 'You do not have permission to modify this item'}), 403
+        if not list_obj or list_obj.user_id != user_id:
+            return ITEM_MODIFY_FORBIDDEN()
         
         # Validate target list permissions if provided
         if new_list_id is not None and new_list_id != item.list_id:
             new_list_obj = get_list_by_id(new_list_id)
             if not new_list_obj:
-                return jsonify({'error': 'Target list not found'}), 404
-            if new_list_obj.user_id != user.id:
-                return jsonify({'error': 'You do not have permission to move items to this list'}), 403
-
-        # Validate parent if provided (non-null)
-        if new_parent_id is not None:
-            if new_parent_id is not None:
-                parent_item = get_item_by_id(new_parent_id)
-                if new_parent_id is not None and parent_item is None and data.get('parent_id') is not None:
-                    return jsonify({'error': 'Target parent not found'}), 404
-        
-        # Update item using database function
+                return TARGET_LIST_NOT_FOUND()
+            if new_list_obj.user_id != user_id:
+                return ITEM_MOVE_FORBIDDEN()
+        
+        # Update item using database function (validates the target parent)
         updated_item, error_message = update_item(
             item_id,
             title=title,
             completed=completed,
             position=position,
             list_id=new_list_id,
-            parent_id=data.get('parent_id') if 'parent_id' in data else None
+            parent_id=new_parent_id,
+            parent_id_provided=parent_id_provided
         )
         
         if not updated_item:
-            return jsonify({'error': error_message}), 400
+            # Determine status code based on error
+            status_code = 404 if error_message == "Target parent not found" else 400
+            return jsonify({'error': error_message}), status_code
         
         return jsonify({
             'message': 'Item updated successfully',
@@ -226,7 +225,66 @@ def update_existing_item(item_id):
         }), 200
         
     except Exception as e:
-        return jsonify({'error': 'An error occurred while updating the item'}), 500
+        return UPDATE_ITEM_FAILED()
+
+
+@items_bp.route('/lists/<int:list_id>/items/reorder', methods=['PUT'])
+@jwt_required()
+def reorder_list_items(list_id):
+    """
+    Reorder sibling items within a list in a single update.
+    Verifies that the list belongs to the authenticated user.
+    
+    Request body:
+        {
+            "parent_id": int|null (optional - shared parent, null for top-level),
+            "item_ids": [int] (all sibling IDs, in their new order)
+        }
+    
+    Returns:
+        JSON response with success message
+        Status: 200, 400, 403, 404
+    """
+    try:
+        data = request.get_json()
+        
+        # Validate input
+        if not data:
+            return BODY_REQUIRED()
+        
+        parent_id = data.get('parent_id')
+        item_ids = data.get('item_ids')
+        
+        if not isinstance(item_ids, list) or not item_ids:
+            return ITEM_IDS_REQUIRED()
+        
+        if any(not isinstance(item_id, int) or isinstance(item_id, bool) for item_id in item_ids):
+            return INVALID_ITEM_IDS()
+        
+        if parent_id is not None and (not isinstance(parent_id, int) or isinstance(parent_id, bool)):
+            return INVALID_PARENT_ID()
+        
+        # Get user ID from JWT token (no users-table lookup needed)
+        user_id = int(get_jwt_identity())
+        
+        # Get list and verify ownership
+        list_obj = get_list_by_id(list_id)
+        if not list_obj:
+            return LIST_NOT_FOUND()
+        
+        if list_obj.user_id != user_id:
+            return LIST_MODIFY_FORBIDDEN()
+        
+        # Reorder items using database function
+        success, error_message = reorder_items(list_id, parent_id, item_ids)
+        
+        if not success:
+            return jsonify({'error': error_message}), 400
+        
+        return jsonify({'message': 'Items reordered successfully'}), 200
+        
+    except Exception as e:
+        return REORDER_ITEMS_FAILED()
 
 
 @items_bp.route('/items/<int:item_id>', methods=['DELETE'])
@@ -242,21 +300,17 @@ def delete_existing_item(item_id):
         Status: 200, 403, 404
     """
     try:
-        # Get user email from JWT token
-        email = get_jwt_identity()
-        user = get_user_by_email(email)
-        
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
+        # Get user ID from JWT token (no users-table lookup needed)
+        user_id = int(get_jwt_identity())
         
         # Get item and verify ownership through list
         item = get_item_by_id(item_id)
         if not item:
-            return jsonify({'error': 'Item not found'}), 404
+            return ITEM_NOT_FOUND()
         
         list_obj = get_list_by_id(item.list_id)
-        if not list_obj or list_obj.user_id != user.id:
-            return jsonify({'error': 'You do not have permission to delete this item'}), 403
+        if not list_obj or list_obj.user_id != user_id:
+            return ITEM_DELETE_FORBIDDEN()
         
         # Delete item using database function
         success, error_message = delete_item(item_id)
@@ -267,5 +321,5 @@ def delete_existing_item(item_id):
         return jsonify({'message': 'Item deleted successfully'}), 200
         
     except Exception as e:
-        return jsonify({'error': 'An error occurred while deleting the item'}), 500
+        return DELETE_ITEM_FAILED()
 
@@ -5,13 +5,24 @@ All endpoints require JWT authentication.
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from database import (
-    get_user_by_email,
     get_user_lists,
     get_list_by_id,
     create_list,
     update_list,
     delete_list
 )
+from responses import (
+    BODY_REQUIRED,
+    TITLE_REQUIRED,
+    LIST_UPDATE_FIELDS_REQUIRED,
+    LIST_NOT_FOUND,
+    LIST_MODIFY_FORBIDDEN,
+    LIST_DELETE_FORBIDDEN,
+    FETCH_LISTS_FAILED,
+    CREATE_LIST_FAILED,
+    UPDATE_LIST_FAILED,
+    DELETE_LIST_FAILED
+)
 
 # Create blueprint for list routes
 lists_bp = Blueprint('lists', __name__, url_prefix='/lists')
@@ -28,15 +39,11 @@ def get_lists():
         Status: 200
     """
     try:
-        # Get user email from JWT token
-        email = get_jwt_identity()
-        user = get_user_by_email(email)
-        
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
+        # Get user ID from JWT token (no users-table lookup needed)
+        user_id = int(get_jwt_identity())
         
         # Get all lists for the user
-        lists = get_user_lists(user.id)
+        lists = get_user_lists(user_id)
         
         # Convert to dictionary format
         lists_data = [lst.to_dict() for lst in lists]
@@ -44,7 +51,7 @@ def get_lists():
         return jsonify({'lists': lists_data}), 200
         
     except Exception as e:
-        return jsonify({'error': 'An error occurred while fetching lists'}), 500
+        return FETCH_LISTS_FAILED()
 
 
 @lists_bp.route('', methods=['POST'])
@@ -67,23 +74,19 @@ def create_new_list():
         
         # Validate input
         if not data:
-            return jsonify({'error': 'Request body is required'}), 400
+            return BODY_REQUIRED()
         
         title = data.get('title', '').strip()
         
         # Validate required fields
         if not title:
-            return jsonify({'error': 'Title is required'}), 400
-        
-        # Get user email from JWT token
-        email = get_jwt_identity()
-        user = get_user_by_email(email)
+            return TITLE_REQUIRED()
         
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
+        # Get user ID from JWT token (no users-table lookup needed)
+        user_id = int(get_jwt_identity())
         
         # Create list using database function
-        new_list, error_message = create_list(user.id, title)
+        new_list, error_message = create_list(user_id, title)
         
         if not new_list:
             return jsonify({'error': error_message}), 400
@@ -98,7 +101,7 @@ def create_new_list():
         }), 201
         
     except Exception as e:
-        return jsonify({'error': 'An error occurred while creating the list'}), 500
+        return CREATE_LIST_FAILED()
 
 
 @lists_bp.route('/<int:list_id>', methods=['PUT'])
@@ -123,29 +126,25 @@ def update_existing_list(list_id):
         
         # Validate input
         if not data:
-            return jsonify({'error': 'Request body is required'}), 400
+            return BODY_REQUIRED()
         
         title = data.get('title')
         position = data.get('position')
         
         # At least one field must be provided
         if title is None and position is None:
-            return jsonify({'error': 'At least one field (title or position) must be provided'}), 400
+            return LIST_UPDATE_FIELDS_REQUIRED()
         
-        # Get user email from JWT token
-        email = get_jwt_identity()
-        user = get_user_by_email(email)
-        
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
+        # Get user ID from JWT token (no users-table lookup needed)
+        user_id = int(get_jwt_identity())
         
         # Get list and verify ownership
         list_obj = get_list_by_id(list_id)
         if not list_obj:
-            return jsonify({'error': 'List not found'}), 404
+            return LIST_NOT_FOUND()
         
-        if list_obj.user_id != user.id:
-            return jsonify({'error': 'You do not have permission to modify this list'}), 403
+        if list_obj.user_id != user_id:
+            return LIST_MODIFY_FORBIDDEN()
         
         # Update list using database function
         updated_list, error_message = update_list(list_id, title=title, position=position)
@@ -163,7 +162,7 @@ def update_existing_list(list_id):
         }), 200
         
     except Exception as e:
-        return jsonify({'error': 'An error occurred while updating the list'}), 500
+        return UPDATE_LIST_FAILED()
 
 
 @lists_bp.route('/<int:list_id>', methods=['DELETE'])
@@ -179,20 +178,16 @@ def delete_existing_list(list_id):
         Status: 200, 403, 404
     """
     try:
-        # Get user email from JWT token
-        email = get_jwt_identity()
-        user = get_user_by_email(email)
-        
-        if not user:
-            return jsonify({'error': 'User not found'}), 404
+        # Get user ID from JWT token (no users-table lookup needed)
+        user_id = int(get_jwt_identity())
         
         # Get list and verify ownership
         list_obj = get_list_by_id(list_id)
         if not list_obj:
-            return jsonify({'error': 'List not found'}), 404
+            return LIST_NOT_FOUND()
         
-        if list_obj.user_id != user.id:
-            return jsonify({'error': 'You do not have permission to delete this list'}), 403
+        if list_obj.user_id != user_id:
+            return LIST_DELETE_FORBIDDEN()
         
         # Delete list using database function
         success, error_message = delete_list(list_id)
@@ -203,5 +198,5 @@ def delete_existing_list(list_id):
         return jsonify({'message': 'List deleted successfully'}), 200
         
     except Exception as e:
-        return jsonify({'error': 'An error occurred while deleting the list'}), 500
+        return DELETE_LIST_FAILED()
 
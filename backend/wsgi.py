@@ -0,0 +1,9 @@
+"""
+WSGI entry point for production servers.
+
+Run with gunicorn, e.g.:
+    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5001 wsgi:application
+"""
+from app import create_app
+
+application = create_app()